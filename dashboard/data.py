@@ -0,0 +1,207 @@
+import streamlit as st
+import pandas as pd
+import numpy as np
+import requests
+import urllib3
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import os
+import threading
+from pathlib import Path
+import tempfile
+
+DATA_URL = 'https://raw.githubusercontent.com/Agnieszka-Kamieniksba23169/Dashboard_CA2/main/movie_df.csv'
+CACHE_DIR = Path(tempfile.gettempdir())
+MAX_LINE_POINTS = 800
+MAX_CACHE_ENTRIES = 64
+# Bump when read_movie_df changes the derived columns or dtypes, so old Parquet copies are ignored
+CACHE_SCHEMA = 'v2'
+
+# Remote file's ETag, re-checked every few minutes rather than on every rerun
+@st.cache_data(ttl=600)
+def remote_etag(url):
+    try:
+        etag = requests.head(url, timeout=10).headers.get('ETag', '')
+    except requests.RequestException:
+        etag = ''
+    return ''.join(c for c in etag if c.isalnum())
+
+# Local Parquet copy of the parsed data, keyed by the remote file's ETag.
+# Without an ETag (e.g. offline) the newest local copy is reused.
+def parquet_cache_path(url):
+    etag = remote_etag(url)
+    if etag:
+        return CACHE_DIR / f"movie_df_{CACHE_SCHEMA}_{etag}.parquet"
+    local_copies = sorted(CACHE_DIR.glob(f"movie_df_{CACHE_SCHEMA}_*.parquet"), key=lambda p: p.stat().st_mtime)
+    return local_copies[-1] if local_copies else CACHE_DIR / f"movie_df_{CACHE_SCHEMA}_latest.parquet"
+
+class MovieDataError(Exception):
+    pass
+
+# Compact dtypes: categorical keys make groupby/value_counts work on int codes.
+# Applied after every read, since a Parquet round trip does not keep e.g. an integer categorical.
+def normalize_dtypes(df):
+    for col in ['primary_genre', 'title', 'userId']:
+        df[col] = df[col].astype('category')
+    return df.astype({'year': 'int16', 'month': 'int8', 'hour': 'int8', 'rating': 'float32'})
+
+def read_movie_df(path):
+    if path.exists():
+        return normalize_dtypes(pd.read_parquet(path))
+    # Parse the response stream directly with pyarrow's multithreaded CSV reader.
+    # Reading response.raw bypasses requests' error wrapping, so urllib3/pyarrow errors are caught too.
+    try:
+        with requests.get(DATA_URL, stream=True, timeout=60) as response:
+            response.raise_for_status()
+            response.raw.decode_content = True
+            table = pacsv.read_csv(response.raw, read_options=pacsv.ReadOptions(use_threads=True))
+    except (requests.RequestException, urllib3.exceptions.HTTPError, pa.ArrowInvalid) as exc:
+        raise MovieDataError(f"Could not load {DATA_URL}") from exc
+    df = table.to_pandas()
+    df['primary_genre'] = df['genres'].str.split('|', n=1).str[0]
+    df['date'] = pd.to_datetime(df[['year', 'month', 'day']], errors='coerce')
+    df = normalize_dtypes(df)
+    # Write to a private temp file and rename, so other sessions never read a partial file
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    df.to_parquet(tmp_path)
+    os.replace(tmp_path, path)
+    # Only the current copy is kept; older ETags and schema versions are removed
+    for old_path in CACHE_DIR.glob("movie_df_*.parquet"):
+        if old_path != path:
+            old_path.unlink(missing_ok=True)
+    return df
+
+# Summary tables keyed on the filter columns, so filtered charts scan K rows instead of N
+def build_facts(df):
+    keys = ['year', 'primary_genre', 'rating']
+    return {
+        'raw': df,
+        'by_month': df.groupby([pd.Grouper(key='date', freq='MS')] + keys, observed=True).size().reset_index(name='count'),
+        'by_hour': df.groupby(['hour'] + keys, observed=True).size().reset_index(name='count'),
+    }
+
+# Row positions of each primary genre, in row order
+def genre_row_index(df):
+    genres = df['primary_genre'].cat
+    codes = genres.codes.values
+    order = np.argsort(codes, kind='stable')[(codes < 0).sum():]
+    bounds = np.cumsum(np.bincount(codes[codes >= 0], minlength=len(genres.categories)))
+    return dict(zip(genres.categories, np.split(order, bounds[:-1])))
+
+# Load data: summary tables plus a per-genre row index for each of them.
+# Keyed on the Parquet path, so a new upstream ETag misses the cache. Kept in memory only:
+# the Parquet copy already covers restarts.
+@st.cache_data(max_entries=2)
+def load_movie_df(cache_path):
+    facts = build_facts(read_movie_df(cache_path))
+    genre_index = {name: genre_row_index(frame) for name, frame in facts.items()}
+    return facts, genre_index
+
+# Sidebar filters: genre via the precomputed row index, then one year/rating mask
+def apply_filters(df, genre_rows, selected_genre, year_range, rating_threshold):
+    rows = genre_rows[selected_genre] if selected_genre != "All" else np.arange(len(df))
+    years = df['year'].values[rows]
+    mask = (years >= year_range[0]) & (years <= year_range[1]) & (df['rating'].values[rows] >= rating_threshold)
+    return df.iloc[rows[mask]]
+
+# Largest-Triangle-Three-Buckets: pick n_out points that keep the shape of the series
+def lttb_indices(x, y, n_out):
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    idx = np.empty(n_out, dtype=np.int64)
+    idx[0], idx[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x, avg_y = x[end:next_end].mean(), y[end:next_end].mean()
+        area = np.abs((x[a] - avg_x) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (avg_y - y[a]))
+        a = start + int(area.argmax())
+        idx[i + 1] = a
+    return idx
+
+# Cached chart data: keyed on data_key = (dataset version, filter values), the frame itself
+# is not hashed; bounded because every new slider position adds an entry
+@st.cache_data(max_entries=MAX_CACHE_ENTRIES)
+def title_stats_data(_filtered_df, data_key):
+    titles = _filtered_df['title'].cat
+    codes = titles.codes.values
+    valid = codes >= 0
+    k = len(titles.categories)
+    return pd.DataFrame({'title': titles.categories,
+                         'num_ratings': np.bincount(codes[valid], minlength=k),
+                         'rating_sum': np.bincount(codes[valid], weights=_filtered_df['rating'].values[valid], minlength=k)})
+
+@st.cache_data(max_entries=MAX_CACHE_ENTRIES)
+def top_movies_data(_filtered_df, data_key, n=20):
+    title_stats = title_stats_data(_filtered_df, data_key)
+    counts = title_stats['num_ratings'].values
+    top_idx = np.argpartition(counts, -n)[-n:] if len(counts) > n else np.arange(len(counts))
+    top_idx = top_idx[np.argsort(counts[top_idx])[::-1]]
+    top_idx = top_idx[counts[top_idx] > 0]
+    return pd.DataFrame({'title': title_stats['title'].values[top_idx], 'count': counts[top_idx]})
+
+@st.cache_data(max_entries=MAX_CACHE_ENTRIES)
+def rating_counts_data(_by_hour, data_key):
+    return _by_hour.groupby('rating')['count'].sum().reset_index()
+
+@st.cache_data(max_entries=MAX_CACHE_ENTRIES)
+def genre_ratings_data(_by_hour, data_key):
+    genres = _by_hour['primary_genre'].cat
+    codes = genres.codes.values
+    valid = codes >= 0
+    k = len(genres.categories)
+    n = _by_hour['count'].values[valid]
+    sums = np.bincount(codes[valid], weights=_by_hour['rating'].values[valid] * n, minlength=k)
+    counts = np.bincount(codes[valid], weights=n, minlength=k)
+    present = counts > 0
+    genre_ratings = pd.DataFrame({'primary_genre': genres.categories[present],
+                                  'rating': sums[present] / counts[present]})
+    return genre_ratings.sort_values('rating', ascending=False, ignore_index=True)
+
+@st.cache_data(max_entries=MAX_CACHE_ENTRIES)
+def monthly_counts_data(_by_month, data_key):
+    monthly_counts = _by_month.groupby(pd.Grouper(key='date', freq='MS'))['count'].sum().reset_index(name='rating_count')
+    x = monthly_counts['date'].values.astype('int64').astype(float)
+    y = monthly_counts['rating_count'].values.astype(float)
+    return monthly_counts.iloc[lttb_indices(x, y, MAX_LINE_POINTS)]
+
+@st.cache_data(max_entries=MAX_CACHE_ENTRIES)
+def hourly_counts_data(_by_hour, data_key):
+    return _by_hour.groupby('hour')['count'].sum().reset_index(name='count')
+
+@st.cache_data(max_entries=MAX_CACHE_ENTRIES)
+def user_activity_data(_filtered_df, data_key, bins=50):
+    codes = _filtered_df['userId'].cat.codes.values
+    counts = np.bincount(codes[codes >= 0])
+    counts = counts[counts > 0]
+    if counts.size == 0:
+        return pd.DataFrame({'rating_count': [], 'num_users': []})
+    heights, edges = np.histogram(counts, bins=bins)
+    return pd.DataFrame({'rating_count': (edges[:-1] + edges[1:]) / 2, 'num_users': heights})
+
+@st.cache_data(max_entries=MAX_CACHE_ENTRIES)
+def genre_freq_data(_filtered_df, data_key):
+    return _filtered_df['genres'].dropna().str.split('|').explode().value_counts()
+
+@st.cache_data(max_entries=MAX_CACHE_ENTRIES)
+def rating_stats_data(_filtered_df, data_key):
+    title_stats = title_stats_data(_filtered_df, data_key)
+    title_stats = title_stats[title_stats['num_ratings'] > 0]
+    return pd.DataFrame({'title': title_stats['title'],
+                         'avg_rating': title_stats['rating_sum'] / title_stats['num_ratings'],
+                         'num_ratings': title_stats['num_ratings']}).reset_index(drop=True)
+
+# Pearson correlation from the covariance matrix, in float32
+@st.cache_data(max_entries=MAX_CACHE_ENTRIES)
+def corr_data(_filtered_df, data_key):
+    numeric_cols = _filtered_df.select_dtypes(include='number').drop(columns=['userId'], errors='ignore')
+    if numeric_cols.shape[1] == 0:
+        return None
+    cov = np.atleast_2d(np.cov(numeric_cols.values, rowvar=False, dtype=np.float32))
+    std = np.sqrt(np.diag(cov))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        corr = cov / np.outer(std, std)
+    return pd.DataFrame(corr, index=numeric_cols.columns, columns=numeric_cols.columns)
@@ -0,0 +1,193 @@
+import streamlit as st
+import plotly.express as px
+import matplotlib.pyplot as plt
+from wordcloud import WordCloud
+import seaborn as sns
+from io import BytesIO
+from concurrent.futures import ThreadPoolExecutor
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+
+from dashboard.data import (DATA_URL, MAX_CACHE_ENTRIES, MovieDataError, parquet_cache_path, load_movie_df, apply_filters,
+                            top_movies_data, rating_counts_data, genre_ratings_data,
+                            monthly_counts_data, hourly_counts_data, user_activity_data,
+                            genre_freq_data, rating_stats_data, corr_data)
+
+# Rendered word cloud as PNG bytes, keyed on the (genre, count) pairs.
+# Each call builds its own WordCloud: generate_from_frequencies stores the layout on the instance.
+@st.cache_data(max_entries=MAX_CACHE_ENTRIES)
+def wordcloud_png(freq_items):
+    wordcloud = WordCloud(width=800, height=400, background_color='white').generate_from_frequencies(dict(freq_items))
+    buf = BytesIO()
+    wordcloud.to_image().save(buf, 'PNG')
+    return buf.getvalue()
+
+# Cached Plotly figures, keyed on the chart name and data_key (dataset version + filter values),
+# so a data refresh never serves an old figure. This saves the px build and
+# validation only: st.plotly_chart still serializes the figure on each rerun. The figures are shared
+# read-only (cache_resource), because a cache_data copy would be re-validated when unpickled.
+PLOT_BUILDERS = {'bar': px.bar, 'line': px.line, 'histogram': px.histogram, 'scatter': px.scatter}
+
+@st.cache_resource(max_entries=MAX_CACHE_ENTRIES)
+def plot_figure(name, kind, _data, data_key, layout=None, **px_kwargs):
+    fig = PLOT_BUILDERS[kind](_data, **px_kwargs)
+    if layout:
+        fig.update_layout(**layout)
+    return fig
+
+# Chart jobs: aggregation + figure, independent of each other
+def top_movies_chart(data, data_key):
+    return plot_figure('top_movies', 'bar', top_movies_data(data['raw'], data_key), data_key, x='count', y='title', orientation='h',
+                       color='count', color_continuous_scale='Viridis',
+                       labels={'count': 'Number of Ratings', 'title': 'Movie Title'},
+                       layout={'yaxis': {'categoryorder': 'total ascending'}})
+
+def ratings_histogram_chart(data, data_key):
+    return plot_figure('ratings_histogram', 'bar', rating_counts_data(data['by_hour'], data_key), data_key, x='rating', y='count',
+                       color_discrete_sequence=['#636EFA'],
+                       layout={'bargap': 0.2, 'xaxis_title': 'Rating', 'yaxis_title': 'Count'})
+
+def genre_ratings_chart(data, data_key):
+    return plot_figure('genre_ratings', 'bar', genre_ratings_data(data['by_hour'], data_key), data_key, x='primary_genre', y='rating',
+                       color='rating', color_continuous_scale='Turbo')
+
+def monthly_counts_chart(data, data_key):
+    return plot_figure('monthly_counts', 'line', monthly_counts_data(data['by_month'], data_key), data_key, x='date', y='rating_count', markers=True,
+                       layout={'xaxis_title': 'Date', 'yaxis_title': 'Ratings Count'})
+
+def hourly_counts_chart(data, data_key):
+    return plot_figure('hourly_counts', 'bar', hourly_counts_data(data['by_hour'], data_key), data_key, x='hour', y='count', color='count',
+                       color_continuous_scale='Cividis')
+
+def user_activity_chart(data, data_key):
+    return plot_figure('user_activity', 'bar', user_activity_data(data['raw'], data_key), data_key, x='rating_count', y='num_users',
+                       color_discrete_sequence=['#00CC96'],
+                       layout={'bargap': 0.2, 'xaxis_title': 'Ratings per User', 'yaxis_title': 'Number of Users'})
+
+def rating_stats_chart(data, data_key):
+    return plot_figure('rating_stats', 'scatter', rating_stats_data(data['raw'], data_key), data_key, x='num_ratings', y='avg_rating',
+                       size='num_ratings', color='avg_rating',
+                       labels={'num_ratings': 'Number of Ratings', 'avg_rating': 'Average Rating'},
+                       color_continuous_scale='Plasma')
+
+CHART_JOBS = {
+    'top_movies': top_movies_chart,
+    'ratings_histogram': ratings_histogram_chart,
+    'genre_ratings': genre_ratings_chart,
+    'monthly_counts': monthly_counts_chart,
+    'hourly_counts': hourly_counts_chart,
+    'user_activity': user_activity_chart,
+    'rating_stats': rating_stats_chart,
+}
+
+# Sidebar filters
+def filters_sidebar(df):
+    st.sidebar.header("🔍 Filters")
+    genre_options = df['primary_genre'].unique().tolist()
+    selected_genre = st.sidebar.selectbox("Select Genre", ["All"] + genre_options)
+    year_range = st.sidebar.slider("Select Year Range", int(df['year'].min()), int(df['year'].max()), (2000, 2020))
+    rating_threshold = st.sidebar.slider("Minimum Rating", 0.0, 5.0, 3.0)
+    return selected_genre, year_range, rating_threshold
+
+# Build the Plotly charts in parallel; worker threads share this session's context
+def build_charts(data, data_key, advanced):
+    chart_jobs = {name: job for name, job in CHART_JOBS.items() if name != 'rating_stats' or advanced}
+    with ThreadPoolExecutor(max_workers=4, initializer=add_script_run_ctx, initargs=(None, get_script_run_ctx())) as executor:
+        return {name: executor.submit(job, data, data_key) for name, job in chart_jobs.items()}
+
+# ---------- Tab 1: Visual Analytics ----------
+def render_visual_analytics(filtered_df, data_key, charts):
+    st.subheader("Top 20 Most Rated Movies")
+    st.plotly_chart(charts['top_movies'].result(), use_container_width=True)
+
+    st.subheader("⭐ Ratings Distribution")
+    st.plotly_chart(charts['ratings_histogram'].result(), use_container_width=True)
+
+    st.subheader("Average Rating by Primary Genre")
+    st.plotly_chart(charts['genre_ratings'].result(), use_container_width=True)
+
+    st.subheader("🎭 Genre Popularity")
+    genre_counts = genre_freq_data(filtered_df, data_key).head(10).reset_index()
+    genre_counts.columns = ['genre', 'count']
+    fig4, ax4 = plt.subplots()
+    sns.barplot(data=genre_counts, x='genre', y='count', ax=ax4, palette="crest")
+    ax4.set_title("Most Watched Genres")
+    ax4.set_xlabel("Genre")
+    ax4.set_ylabel("View Count")
+    ax4.tick_params(axis='x', rotation=45)
+    st.pyplot(fig4)
+
+# ---------- Tab 2: Time Trends ----------
+def render_time_trends(filtered_df, data_key, charts):
+    st.subheader("📅 Ratings Over Time (Monthly)")
+    st.plotly_chart(charts['monthly_counts'].result(), use_container_width=True)
+
+    st.subheader("⏰ Ratings by Hour of Day")
+    st.plotly_chart(charts['hourly_counts'].result(), use_container_width=True)
+
+# ---------- Tab 3: Engagement ----------
+def render_engagement(filtered_df, data_key, charts):
+    st.subheader("☁️ Genre Word Cloud")
+    genre_freq = genre_freq_data(filtered_df, data_key).to_dict()
+    st.image(wordcloud_png(tuple(sorted(genre_freq.items()))))
+
+    st.subheader("👥 User Engagement Distribution")
+    st.plotly_chart(charts['user_activity'].result(), use_container_width=True)
+
+# ---------- Tab 4: Advanced Insights ----------
+def render_advanced(filtered_df, data_key, charts):
+    st.subheader("📉 Correlation Matrix of Numerical Features")
+    corr = corr_data(filtered_df, data_key) if not filtered_df.empty else None
+    if filtered_df.empty:
+        st.info("No ratings match the current filters.")
+    elif corr is not None:
+        fig_corr, ax_corr = plt.subplots(figsize=(10, 6))
+        sns.heatmap(corr, annot=True, cmap='coolwarm', fmt=".2f", ax=ax_corr)
+        st.pyplot(fig_corr)
+    else:
+        st.info("No numeric columns available for correlation analysis.")
+
+    st.subheader("🎯 Average Rating vs. Number of Ratings (per Movie)")
+    st.plotly_chart(charts['rating_stats'].result(), use_container_width=True)
+
+# Full dashboard; the Advanced Insights tab is behind the `advanced` flag
+def main(advanced=True):
+    # Set page config
+    st.set_page_config(page_title="Movie Ratings Dashboard", layout="wide")
+
+    # Load the dataset
+    try:
+        cache_path = parquet_cache_path(DATA_URL)
+        facts, genre_index = load_movie_df(cache_path)
+    except MovieDataError:
+        st.error("❌ Failed to load movie data.")
+        st.stop()
+
+    # App Title and Description
+    st.title("🎬 Movie Ratings Dashboard for Young Adults (18–35)")
+    st.markdown("**Explore rating trends, genre preferences, and user engagement — built for machine learning and recommender systems**")
+
+    filters = filters_sidebar(facts['raw'])
+    data = {name: apply_filters(frame, genre_index[name], *filters) for name, frame in facts.items()}
+    filtered_df = data['raw']
+    # Chart caches are keyed on the dataset version too, so a new upstream file is not served stale results
+    data_key = (cache_path.name, filters)
+    charts = build_charts(data, data_key, advanced)
+
+    # Tabs
+    tab_names = ["📊 Visual Analytics", "📈 Time Trends", "🌟 Engagement"]
+    if advanced:
+        tab_names.append("🧪 Advanced Insights")
+    tabs = st.tabs(tab_names)
+    with tabs[0]:
+        render_visual_analytics(filtered_df, data_key, charts)
+    with tabs[1]:
+        render_time_trends(filtered_df, data_key, charts)
+    with tabs[2]:
+        render_engagement(filtered_df, data_key, charts)
+    if advanced:
+        with tabs[3]:
+            render_advanced(filtered_df, data_key, charts)
+
+    # Footer
+    st.markdown("---")
+    st.caption("🚀 Built for younger adult data explorers (18–35). Ideal for ML and recommendation engines.")